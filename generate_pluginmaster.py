@@ -1,10 +1,113 @@
+import hashlib
+import io
 import json
+import logging
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from remotezip import RemoteZip, RangeNotSupported
 from pathlib import Path
 from zipfile import ZipFile
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes; `pretty` gives the sorted, 2-space indented pluginmaster format."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, obj: Any) -> None:
+    """Write `obj` as pluginmaster-formatted JSON via a temporary file, so readers never see a partial file."""
+    # The .json.tmp suffix is gitignored, so a file left by a killed run is never committed
+    f = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".json.tmp", delete=False, buffering=COPY_BUFFER_SIZE
+    )
+    try:
+        with f:
+            f.write(_json_dumps(obj, pretty=True))
+        # NamedTemporaryFile creates the file owner-only; keep the usual world-readable output mode
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except BaseException:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+
+def _manifest_digest(manifest: Dict[str, Any]) -> bytes:
+    """Stable content hash of a manifest, independent of key order."""
+    return hashlib.blake2b(_json_dumps(manifest, pretty=True), digest_size=16).digest()
+
+
+_GITHUB_RE = re.compile(r"^https?://github\.com/([^/]+)/([^/?#]+?)(?:\.git)?/?$")
+
+
+@lru_cache(maxsize=256)
+def parse_github(url: str) -> Optional[Tuple[str, str]]:
+    """Extract (owner, repo) from a GitHub repository URL, or None if it is not one."""
+    m = _GITHUB_RE.match(url)
+    return m.groups() if m else None
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a dotted version into a comparable tuple; trailing zeros are dropped so 1.2 == 1.2.0."""
+    parts = [int(x) for x in version.split('.')]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+# Buffer size for streaming downloads to memory or disk
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Worker count for the thread pools that talk to GitHub or external download hosts
+HTTP_WORKERS = 16
+# Smaller pools for the follow-up passes (REST download-count fallback, aliases), which mostly
+# revisit repositories already fetched and should stay clear of GitHub's concurrency limits
+HTTP_FOLLOWUP_WORKERS = HTTP_WORKERS // 2
+
+# Shared HTTP session: keeps connections to GitHub alive across every request in a run
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "DalamudPluginsBuilder"
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    # External downloads overlap the repository fetch, so two full pools may hit the same host at once;
+    # a smaller pool would discard and re-handshake the surplus connections
+    pool_maxsize=2 * HTTP_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+))
 
 
 @dataclass
@@ -22,6 +125,11 @@ class Config:
     plugin_aliases: Dict[str, Dict[str, Any]]
     repo: str = "WigglyMuffin/DalamudPlugins"
     global_api_level: int = 13
+    cache_dir: Path = Path("./.cache")
+    required_manifest_keys_set: FrozenSet[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.required_manifest_keys_set = frozenset(self.required_manifest_keys)
 
     @classmethod
     def _load_plugin_sources(cls) -> Tuple[Dict[str, Path], Dict[str, Dict[str, str]], Dict[str, str]]:
@@ -34,7 +142,7 @@ class Config:
 
         sources_path = Path("./plugin-sources.json")
         if not sources_path.exists():
-            print("plugin-sources.json not found, no repository plugins will be processed")
+            logger.warning("plugin-sources.json not found, no repository plugins will be processed")
             return default_output_files, {}, {}
 
         try:
@@ -51,7 +159,7 @@ class Config:
             plugin_outputs = {}
             for plugin_name, plugin_config in sources.get("plugins", {}).items():
                 if not plugin_config.get("enabled", True):
-                    print(f"Skipping disabled plugin: {plugin_name}")
+                    logger.debug("Skipping disabled plugin: %s", plugin_name)
                     continue
                 repository_list[plugin_name] = {
                     "url": plugin_config["url"],
@@ -59,11 +167,11 @@ class Config:
                 }
                 plugin_outputs[plugin_name] = plugin_config.get("output", "default")
 
-            print(f"Loaded {len(repository_list)} plugins from plugin-sources.json with {len(output_files)} output(s)")
+            logger.info(f"Loaded {len(repository_list)} plugins from plugin-sources.json with {len(output_files)} output(s)")
             return output_files, repository_list, plugin_outputs
 
         except Exception as e:
-            print(f"Error loading plugin-sources.json: {e}, no repository plugins will be processed")
+            logger.warning(f"Error loading plugin-sources.json: {e}, no repository plugins will be processed")
             return default_output_files, {}, {}
 
     @classmethod
@@ -101,21 +209,384 @@ class Config:
             plugin_aliases=plugin_aliases
         )
 
+class TokenRegistry:
+    """Resolves GitHub tokens from the environment once and caches their request headers."""
+
+    def __init__(self, config: Config):
+        # Collect all token names referenced in plugin-sources.json and resolve from env
+        token_names = {rc["token"] for rc in config.repository_list.values()}
+        token_names.add("GITHUB_TOKEN")  # always available
+        self._tokens = {name: os.environ.get(name) for name in token_names}
+        self._headers: Dict[str, Dict[str, str]] = {}
+        self._asset_headers: Dict[str, Dict[str, str]] = {}
+        for name in token_names:
+            self._build_headers(name)
+
+    def _build_headers(self, name: str) -> None:
+        if name not in self._tokens:
+            self._tokens[name] = os.environ.get(name)
+        token = self._tokens[name]
+        self._headers[name] = {"Authorization": f"token {token}"} if token else {}
+        self._asset_headers[name] = {**self._headers[name], "Accept": "application/octet-stream"} if token else {}
+
+    def token(self, name: str) -> Optional[str]:
+        """Return the raw token value for an environment variable name."""
+        if name not in self._tokens:
+            self._build_headers(name)
+        return self._tokens[name]
+
+    def headers_for(self, name: Optional[str]) -> Dict[str, str]:
+        """Return shared API request headers for a token name (empty when unset). Do not mutate."""
+        if not name:
+            return {}
+        if name not in self._headers:
+            self._build_headers(name)
+        return self._headers[name]
+
+    def asset_headers_for(self, name: Optional[str]) -> Dict[str, str]:
+        """Return shared headers for downloading release asset binaries. Do not mutate."""
+        if not name:
+            return {}
+        if name not in self._asset_headers:
+            self._build_headers(name)
+        return self._asset_headers[name]
+
+
+class _ReleaseCache:
+    """Disk cache of GitHub release listings, revalidated with ETags.
+
+    A 304 Not Modified reply costs no primary rate limit and carries no body,
+    so unchanged pages are served from the cached JSON.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return _json_loads(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable release cache {path}: {e}")
+            return None
+
+    def _store(self, key: str, etag: str, data: Any) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._path(key).write_bytes(_json_dumps({"etag": etag, "json": data}))
+        except Exception as e:
+            logger.warning(f"Could not write release cache for {key}: {e}")
+
+    def get(self, key: str, url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None) -> Tuple[int, Any]:
+        """Return (status_code, json) for a GitHub API URL, sending If-None-Match when cached."""
+        cached = self._load(key)
+        request_headers = dict(headers)
+        if cached and cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+
+        response = SESSION.get(url, headers=request_headers, params=params)
+
+        if response.status_code == 304 and cached:
+            return 200, cached["json"]
+        if response.status_code != 200:
+            return response.status_code, None
+
+        data = _json_loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._store(key, etag, data)
+        return 200, data
+
+
+class _ManifestCache:
+    """Disk cache of parsed release-asset manifests keyed by the asset's ETag.
+
+    Unchanged assets skip the ranged ZIP download and JSON parse entirely.
+    Cached manifests are already trimmed, so the kept key set is part of the
+    key too: changing `required_manifest_keys` invalidates every entry.
+    Entries a run does not use are removed by `prune`, so superseded
+    releases do not pile up in the restored CI cache.
+    """
+
+    def __init__(self, cache_dir: Path, kept_keys: FrozenSet[str]):
+        self.cache_dir = cache_dir
+        self._schema = ",".join(sorted(kept_keys))
+        self._touched = set()
+
+    def _path(self, plugin_name: str, fingerprint: str) -> Path:
+        digest = hashlib.sha1(f"{self._schema}|{fingerprint}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{plugin_name}__{digest}.json"
+
+    def load(self, plugin_name: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        path = self._path(plugin_name, fingerprint)
+        self._touched.add(path.name)
+        if not path.exists():
+            return None
+        try:
+            return _json_loads(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable manifest cache {path}: {e}")
+            return None
+
+    def store(self, plugin_name: str, fingerprint: str, manifest: Dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(plugin_name, fingerprint)
+            self._touched.add(path.name)
+            path.write_bytes(_json_dumps(manifest))
+        except Exception as e:
+            logger.warning(f"Could not write manifest cache for {plugin_name}: {e}")
+
+    def prune(self) -> None:
+        """Delete cached manifests that were neither loaded nor stored during this run."""
+        if not self.cache_dir.is_dir():
+            return
+        removed = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.name not in self._touched and entry.is_file():
+                    os.unlink(entry.path)
+                    removed += 1
+        if removed:
+            logger.info(f"Pruned {removed} unused cached manifests")
+
+
+class _SingleFlight:
+    """Runs a keyed call once while it is in flight; concurrent callers wait on the same Future.
+
+    A result is kept for later callers only when `keep(result)` is true, so
+    failures can be retried once the call that produced them has finished.
+    """
+
+    def __init__(self):
+        self._futures: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Any, fn, keep=lambda result: True) -> Any:
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._futures[key] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._futures[key]
+            future.set_exception(e)
+            raise
+        if not keep(result):
+            with self._lock:
+                del self._futures[key]
+        future.set_result(result)
+        return result
+
+
+def _is_ok(result: Tuple[int, Any]) -> bool:
+    return result[0] == 200
+
+
+class RepositoryFetcher:
+    """Fetches each repository's release list once per run and shares it.
+
+    The `/releases` listing holds any testing pre-release and per-asset download
+    counts, so testing lookups and download counting read from the same
+    memoized list. The stable release is taken from `/releases/latest`, so
+    manifests agree with the `releases/latest/download` install links.
+    """
+
+    def __init__(self, config: Config):
+        self.release_cache = _ReleaseCache(config.cache_dir / "releases")
+        self._releases_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._latest_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Concurrent callers for the same repository and token share one fetch
+        self._flights = _SingleFlight()
+
+    def get_all_releases(self, owner: str, repo: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Optional[List[Dict[str, Any]]]]:
+        """Return (status_code, releases) for a repository, paginating `/releases` once.
+
+        Only successful listings are memoized, so a later caller holding a
+        different token can still retry a repository that failed earlier.
+        """
+        with self._lock:
+            if (owner, repo) in self._releases_cache:
+                return 200, self._releases_cache[(owner, repo)]
+
+        headers = headers or {}
+        return self._flights.run(
+            ("releases", owner, repo, headers.get("Authorization")),
+            lambda: self._fetch_all_releases(owner, repo, headers),
+            keep=_is_ok
+        )
+
+    def _fetch_all_releases(self, owner: str, repo: str, headers: Dict[str, str]) -> Tuple[int, Optional[List[Dict[str, Any]]]]:
+        api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+        releases = []
+        page = 1
+        while True:
+            status_code, page_releases = self.release_cache.get(
+                f"{owner}__{repo}__page{page}", api_url, headers,
+                params={"per_page": 100, "page": page}
+            )
+            if status_code != 200:
+                return status_code, None
+            if not page_releases:
+                break
+
+            releases.extend(page_releases)
+            if len(page_releases) < 100:
+                break
+            page += 1
+
+        with self._lock:
+            self._releases_cache[(owner, repo)] = releases
+        return 200, releases
+
+    def has_releases(self, owner: str, repo: str) -> bool:
+        """Whether a repository's release list is already memoized for this run."""
+        with self._lock:
+            return (owner, repo) in self._releases_cache
+
+    def get_latest_release(self, owner: str, repo: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Return (status_code, release) from `/releases/latest`, revalidated through the ETag cache.
+
+        GitHub's choice of latest honours `make_latest`, so it can differ from
+        the first stable entry of the listing. A 404 means no published release.
+        """
+        with self._lock:
+            if (owner, repo) in self._latest_cache:
+                return 200, self._latest_cache[(owner, repo)]
+
+        headers = headers or {}
+        return self._flights.run(
+            ("latest", owner, repo, headers.get("Authorization")),
+            lambda: self._fetch_latest_release(owner, repo, headers),
+            keep=_is_ok
+        )
+
+    def _fetch_latest_release(self, owner: str, repo: str, headers: Dict[str, str]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        status_code, release = self.release_cache.get(
+            f"{owner}__{repo}__latest",
+            f"https://api.github.com/repos/{owner}/{repo}/releases/latest",
+            headers
+        )
+        if status_code != 200:
+            return status_code, None
+
+        with self._lock:
+            self._latest_cache[(owner, repo)] = release
+        return 200, release
+
+
+class GitHubGraphQL:
+    """Batches release listings for many repositories into aliased GraphQL queries.
+
+    One POST covers up to BATCH_SIZE repositories, replacing a paginated REST
+    walk per repository. Repositories that fail or have more releases than
+    fit in one page are omitted so callers can fall back to REST.
+    """
+
+    API_URL = "https://api.github.com/graphql"
+    BATCH_SIZE = 25
+
+    def __init__(self, token: str):
+        self.headers = {"Authorization": f"bearer {token}"}
+
+    def fetch_releases(self, repos: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """Return REST-shaped release lists keyed by (owner, repo)."""
+        results = {}
+        for start in range(0, len(repos), self.BATCH_SIZE):
+            batch = repos[start:start + self.BATCH_SIZE]
+            try:
+                results.update(self._fetch_batch(batch))
+            except Exception as e:
+                logger.warning(f"GraphQL release query failed for {len(batch)} repositories: {e}")
+        return results
+
+    def _fetch_batch(self, batch: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        fields = (
+            "releases(first: 100, orderBy: {field: CREATED_AT, direction: DESC}) {"
+            " pageInfo { hasNextPage }"
+            " nodes { tagName isDraft isPrerelease publishedAt"
+            " releaseAssets(first: 100) { pageInfo { hasNextPage } nodes { name downloadCount } } } }"
+        )
+        aliases = [
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{ {fields} }}"
+            for i, (owner, repo) in enumerate(batch)
+        ]
+        query = "query { " + " ".join(aliases) + " }"
+
+        response = SESSION.post(self.API_URL, headers=self.headers, json={"query": query})
+        response.raise_for_status()
+        data = _json_loads(response.content).get("data") or {}
+
+        results = {}
+        for i, key in enumerate(batch):
+            repository = data.get(f"r{i}")
+            if not repository:
+                continue
+
+            releases = repository["releases"]
+            if releases["pageInfo"]["hasNextPage"]:
+                continue
+
+            nodes = releases["nodes"]
+            if any(node["releaseAssets"]["pageInfo"]["hasNextPage"] for node in nodes):
+                continue
+
+            results[key] = [
+                {
+                    "tag_name": node["tagName"],
+                    "draft": node["isDraft"],
+                    "prerelease": node["isPrerelease"],
+                    "published_at": node["publishedAt"],
+                    "assets": [
+                        {"name": asset["name"], "download_count": asset["downloadCount"]}
+                        for asset in node["releaseAssets"]["nodes"]
+                    ]
+                }
+                for node in nodes
+            ]
+        return results
+
+
+def _keep_keys(manifest: Dict[str, Any], keys: FrozenSet[str]) -> Dict[str, Any]:
+    """Return a copy of a manifest restricted to the given top-level keys."""
+    return {k: v for k, v in manifest.items() if k in keys}
+
+
 class PluginProcessor:
     """Handles processing of individual plugin manifests."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, fetcher: RepositoryFetcher):
         self.config = config
+        self.fetcher = fetcher
+        # ZIP path -> mtime, recorded from the stat taken while reading the manifest
+        self.zip_mtimes: Dict[Path, int] = {}
 
     def extract_manifest_from_zip(self, zip_path: Path, plugin_name: str) -> Optional[Dict[str, Any]]:
-        """Extract and parse manifest from a plugin ZIP file."""
+        """Extract and parse manifest from a plugin ZIP file; a missing file returns None quietly."""
+        try:
+            stat = zip_path.stat()
+        except OSError:
+            # Same outcome as the exists() check this replaces
+            return None
+        self.zip_mtimes[zip_path] = int(stat.st_mtime)
         try:
             with ZipFile(zip_path) as z:
-                manifest_data = z.read(f"{plugin_name}.json").decode("utf-8")
-                manifest = json.loads(manifest_data)
-                return manifest
+                # Drop unused fields right away so they are never held in memory
+                return _keep_keys(_json_loads(z.read(f"{plugin_name}.json")), self.config.required_manifest_keys_set)
         except Exception as e:
-            print(f"Error reading manifest from {zip_path}: {e}")
+            logger.warning(f"Error reading manifest from {zip_path}: {e}")
             return None
 
     def process_plugin_directory(self, plugin_dir: Path) -> List[Dict[str, Any]]:
@@ -123,35 +594,32 @@ class PluginProcessor:
         manifests = []
         plugin_name = plugin_dir.name
         
-        main_zip = plugin_dir / "latest.zip"
-        if not main_zip.exists():
-            return manifests
-
-        base_manifest = self.extract_manifest_from_zip(main_zip, plugin_name)
+        # Missing ZIPs are detected by the extraction's own stat, so no separate exists() checks
+        base_manifest = self.extract_manifest_from_zip(plugin_dir / "latest.zip", plugin_name)
         if not base_manifest:
             return manifests
 
-        testing_zip = plugin_dir / "testing" / "latest.zip"
-        if testing_zip.exists():
-            testing_manifest = self.extract_manifest_from_zip(testing_zip, plugin_name)
-            if testing_manifest:
-                base_manifest["TestingAssemblyVersion"] = testing_manifest.get("AssemblyVersion")
-                base_manifest["TestingDalamudApiLevel"] = testing_manifest.get("DalamudApiLevel")
+        # Only the testing build's version fields are merged into the main manifest
+        testing_manifest = self.extract_manifest_from_zip(plugin_dir / "testing" / "latest.zip", plugin_name)
+        if testing_manifest:
+            base_manifest["TestingAssemblyVersion"] = testing_manifest.get("AssemblyVersion")
+            base_manifest["TestingDalamudApiLevel"] = testing_manifest.get("DalamudApiLevel")
 
         manifests.append(base_manifest)
 
-        global_zip = plugin_dir / "global" / "latest.zip"
-        if global_zip.exists():
-            global_manifest = self.extract_manifest_from_zip(global_zip, plugin_name)
-            if global_manifest:
-                global_manifest["Name"] = f"{global_manifest['Name']} (API{self.config.global_api_level})"
-                manifests.append(global_manifest)
+        global_manifest = self.extract_manifest_from_zip(plugin_dir / "global" / "latest.zip", plugin_name)
+        if global_manifest:
+            global_manifest["Name"] = f"{global_manifest['Name']} (API{self.config.global_api_level})"
+            manifests.append(global_manifest)
 
         return manifests
 
-    def trim_manifest(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
-        """Keep only required keys from manifest."""
-        return {k: manifest[k] for k in self.config.required_manifest_keys if k in manifest}
+    def trim_manifest(self, manifest: Dict[str, Any], preserve: Iterable[str] = ()) -> Dict[str, Any]:
+        """Keep only required keys (plus any `preserve` keys) from manifest, dropping other private bookkeeping keys."""
+        keys = self.config.required_manifest_keys_set
+        if preserve:
+            keys = keys.union(preserve)
+        return _keep_keys(manifest, keys)
 
     def add_download_links(self, manifest: Dict[str, Any]) -> None:
         """Add download links and other computed fields to manifest."""
@@ -161,42 +629,31 @@ class PluginProcessor:
 
         # Check if we have a stored repository asset URL (for private repos or non-standard assets)
         if "_repository_asset_url" in manifest:
-            asset_api_url = manifest["_repository_asset_url"]
-            repo_url = manifest.get("RepoUrl", "")
-            
-            # Extract asset ID from API URL and construct public download URL
-            # API URL format: https://api.github.com/repos/{owner}/{repo}/releases/assets/{id}
-            owner_repo = repo_url.replace("https://github.com/", "").rstrip("/")
-            
-            try:
-                token_name = manifest.get("_repository_token_name")
-                if token_name:
-                    token = os.environ.get(token_name)
-                    headers = {"Authorization": f"token {token}"}
-                    response = requests.get(asset_api_url, headers=headers)
-                    if response.status_code == 200:
-                        asset_info = response.json()
-                        asset_name = asset_info.get("name")
-                        if asset_name:
-                            manifest["DownloadLinkInstall"] = f"https://github.com/{owner_repo}/releases/latest/download/{asset_name}"
-                            print(f"Using repository releases for {plugin_name}: {manifest['DownloadLinkInstall']}")
-                        else:
-                            print(f"WARNING: Could not determine asset name for {plugin_name}")
-            except Exception as e:
-                print(f"Error resolving asset URL for {plugin_name}: {e}")
+            # The asset name comes from the (ETag-revalidated) release listing, so no asset API call is needed
+            asset_name = manifest.get("_repository_asset_name")
+            parsed = parse_github(manifest.get("RepoUrl", ""))
+
+            if not parsed:
+                logger.warning(f"Invalid repository URL for {plugin_name}: {manifest.get('RepoUrl', '')}")
+            elif asset_name:
+                owner, repo = parsed
+                manifest["DownloadLinkInstall"] = f"https://github.com/{owner}/{repo}/releases/latest/download/{asset_name}"
+                logger.debug("Using repository releases for %s: %s", plugin_name, manifest['DownloadLinkInstall'])
+            else:
+                logger.warning(f"Could not determine asset name for {plugin_name}")
         elif is_from_repository:
             repo_download_url = self._get_repo_download_url(manifest)
             if repo_download_url:
                 manifest["DownloadLinkInstall"] = repo_download_url
-                print(f"Using repository releases for {plugin_name}: {repo_download_url}")
+                logger.debug("Using repository releases for %s: %s", plugin_name, repo_download_url)
             else:
-                print(f"WARNING: Repository plugin {plugin_name} has no releases and no local files - skipping download links")
+                logger.warning(f"Repository plugin {plugin_name} has no releases and no local files - skipping download links")
         elif not is_from_repository:
             url_key = "global" if is_global else "main"
             manifest["DownloadLinkInstall"] = self.config.download_urls[url_key].format(
                 branch=self.config.branch, plugin_name=plugin_name
             )
-            print(f"Using local files for {plugin_name}")
+            logger.debug("Using local files for %s", plugin_name)
 
         if "TestingAssemblyVersion" in manifest and not is_global:
             if "_testing_download_url" in manifest:
@@ -215,62 +672,44 @@ class PluginProcessor:
             icon_path = Path("icons") / f"{plugin_name}.png"
             if icon_path.exists():
                 manifest["IconUrl"] = f"https://raw.githubusercontent.com/{self.config.repo}/main/icons/{plugin_name}.png"
-                print(f"Added icon URL for {plugin_name}")
+                logger.debug("Added icon URL for %s", plugin_name)
 
         manifest["DownloadCount"] = 0
 
     def _get_repo_download_url(self, manifest: Dict[str, Any]) -> Optional[str]:
         """Get download URL from repository releases if available."""
         try:
-            repo_url = manifest.get("RepoUrl", "")
-            if not repo_url or "github.com" not in repo_url:
-                return None
-
-            repo_path = repo_url.replace("https://github.com/", "").rstrip("/")
-            if "/" not in repo_path:
+            parsed = parse_github(manifest.get("RepoUrl", ""))
+            if not parsed:
                 return None
+            owner, repo = parsed
 
-            owner, repo = repo_path.split("/", 1)
-
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-            response = requests.get(api_url)
-
-            if response.status_code == 200:
-                release_data = response.json()
+            status_code, release_data = self.fetcher.get_latest_release(owner, repo)
+            if status_code != 200:
+                release_data = None
 
+            if release_data:
                 plugin_name = manifest["InternalName"]
-                assets = release_data.get("assets", [])
+                asset_names = [asset.get("name", "") for asset in release_data.get("assets", [])]
+                available = set(asset_names)
+                zip_names = [name for name in asset_names if name.endswith(".zip")]
 
                 preferred_asset_name = None
-
-                for asset in assets:
-                    asset_name = asset.get("name", "")
-                    if asset_name == "latest.zip":
-                        preferred_asset_name = asset_name
-                        break
+                if "latest.zip" in available:
+                    preferred_asset_name = "latest.zip"
 
                 if not preferred_asset_name:
-                    for asset in assets:
-                        asset_name = asset.get("name", "")
-                        if (asset_name.endswith(".zip") and 
-                            asset_name.startswith(f"{plugin_name}-") and 
-                            not asset_name.endswith("-latest.zip")):
-                            preferred_asset_name = asset_name
-                            break
+                    preferred_asset_name = next(
+                        (name for name in zip_names
+                         if name.startswith(f"{plugin_name}-") and not name.endswith("-latest.zip")),
+                        None
+                    )
 
-                if not preferred_asset_name:
-                    for asset in assets:
-                        asset_name = asset.get("name", "")
-                        if asset_name == f"{plugin_name}.zip":
-                            preferred_asset_name = asset_name
-                            break
+                if not preferred_asset_name and f"{plugin_name}.zip" in available:
+                    preferred_asset_name = f"{plugin_name}.zip"
 
-                if not preferred_asset_name:
-                    for asset in assets:
-                        asset_name = asset.get("name", "")
-                        if asset_name.endswith(".zip"):
-                            preferred_asset_name = asset_name
-                            break
+                if not preferred_asset_name and zip_names:
+                    preferred_asset_name = zip_names[0]
 
                 if preferred_asset_name:
                     stable_url = f"https://github.com/{owner}/{repo}/releases/latest/download/{preferred_asset_name}"
@@ -279,30 +718,48 @@ class PluginProcessor:
             return None
 
         except Exception as e:
-            print(f"Error checking repository releases for {manifest.get('InternalName', 'unknown')}: {e}")
+            logger.warning(f"Error checking repository releases for {manifest.get('InternalName', 'unknown')}: {e}")
             return None
 
 
+@lru_cache(maxsize=256)
+def _manifest_candidates(plugin_name: str) -> Tuple[str, ...]:
+    """Manifest file names a plugin ZIP may use, in priority order."""
+    return (
+        f"{plugin_name}.json",
+        f"{plugin_name.replace(' ', '')}.json",  # No spaces
+        f"{plugin_name.replace(' ', '-')}.json",  # Dashes instead of spaces
+    )
+
+
 class RepositoryPluginProcessor:
     """Handles processing plugins directly from GitHub repositories."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, fetcher: RepositoryFetcher, tokens: TokenRegistry):
         self.config = config
-        # Collect all token names referenced in plugin-sources.json and resolve from env
-        token_names = {rc["token"] for rc in config.repository_list.values()}
-        token_names.add("GITHUB_TOKEN")  # always available
-        self.tokens = {name: os.environ.get(name) for name in token_names}
+        self.fetcher = fetcher
+        self.tokens = tokens
+        self.manifest_cache = _ManifestCache(config.cache_dir / "manifests", config.required_manifest_keys_set)
+        # (plugin_name, repo_url, token_name) -> extracted manifest; aliases and the main fetch share one extraction
+        self._manifest_flights = _SingleFlight()
 
     def get_repository_plugins(self) -> List[Dict[str, Any]]:
-        """Get plugin manifests from configured repositories."""
+        """Get plugin manifests from configured repositories.
+
+        Repositories are fetched concurrently; results keep the plugin-sources.json order.
+        """
         manifests = []
 
-        for plugin_name, repo_config in self.config.repository_list.items():
-            repo_url = repo_config["url"]
-            token_name = repo_config["token"]
-            print(f"Processing repository plugin: {plugin_name} from {repo_url} (using {token_name})")
+        with ThreadPoolExecutor(max_workers=HTTP_WORKERS) as executor:
+            futures = []
+            for plugin_name, repo_config in self.config.repository_list.items():
+                logger.debug("Processing repository plugin: %s from %s (using %s)", plugin_name, repo_config['url'], repo_config['token'])
+                future = executor.submit(self.get_manifest,
+                                         plugin_name, repo_config["url"], repo_config["token"])
+                futures.append((plugin_name, future))
 
-            repo_manifest = self._get_manifest_from_repository(plugin_name, repo_url, token_name)
+        for plugin_name, future in futures:
+            repo_manifest = future.result()
             if repo_manifest:
                 # Tag output routing now while we have the correct plugin-sources.json key
                 repo_manifest["_output_name"] = self.config.plugin_outputs.get(plugin_name, "default")
@@ -310,39 +767,41 @@ class RepositoryPluginProcessor:
 
         return manifests
 
+    def get_manifest(self, plugin_name: str, repo_url: str, token_name: str) -> Optional[Dict[str, Any]]:
+        """Memoized _get_manifest_from_repository; each call returns its own copy to mutate."""
+        manifest = self._manifest_flights.run(
+            (plugin_name, repo_url, token_name),
+            lambda: self._get_manifest_from_repository(plugin_name, repo_url, token_name)
+        )
+        return dict(manifest) if manifest else None
+
     def _get_manifest_from_repository(self, plugin_name: str, repo_url: str, token_name: str) -> Optional[Dict[str, Any]]:
         """Extract manifest from a GitHub repository's latest release."""
         try:
-            repo_path = repo_url.replace("https://github.com/", "").rstrip("/")
-            if "/" not in repo_path:
-                print(f"Invalid repository URL format for {plugin_name}: {repo_url}")
+            parsed = parse_github(repo_url)
+            if not parsed:
+                logger.warning(f"Invalid repository URL format for {plugin_name}: {repo_url}")
                 return None
+            owner, repo = parsed
 
-            owner, repo = repo_path.split("/", 1)
-
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-            
-            # Get the specified token
-            token = self.tokens.get(token_name)
-            headers = {"Authorization": f"token {token}"} if token else {}
+            # Get the specified token's headers
+            headers = self.tokens.headers_for(token_name)
             
-            response = requests.get(api_url, headers=headers)
+            # The latest release is the only required call; the full listing just adds testing info
+            status_code, release_data = self.fetcher.get_latest_release(owner, repo, headers)
 
-            if response.status_code == 404:
-                print(f"Repository {owner}/{repo} not found or private - skipping")
+            if status_code == 404:
+                logger.warning(f"Repository {owner}/{repo} not found, private or without published releases - skipping")
                 return None
-            elif response.status_code == 403:
-                print(f"Access forbidden for {owner}/{repo} (rate limited or private) - skipping")
+            elif status_code == 403:
+                logger.warning(f"Access forbidden for {owner}/{repo} (rate limited or private) - skipping")
                 return None
-            elif response.status_code != 200:
-                print(f"Error accessing repository {owner}/{repo}: HTTP {response.status_code}")
+            elif status_code != 200:
+                logger.warning(f"Error accessing repository {owner}/{repo}: HTTP {status_code}")
                 return None
 
-            release_data = response.json()
-
             release_date = release_data.get("published_at")
             if release_date:
-                from datetime import datetime
                 try:
                     dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
                     release_timestamp = str(int(dt.timestamp()))
@@ -351,82 +810,92 @@ class RepositoryPluginProcessor:
             else:
                 release_timestamp = None
 
-            plugin_zip_url = self._find_plugin_asset(release_data, plugin_name)
+            plugin_asset = self._find_plugin_asset(release_data, plugin_name)
+            plugin_zip_url = plugin_asset.get("url") if plugin_asset else None
             if not plugin_zip_url:
-                print(f"No suitable ZIP asset found for {plugin_name} in {owner}/{repo}")
+                logger.warning(f"No suitable ZIP asset found for {plugin_name} in {owner}/{repo}")
                 return None
 
-            manifest = self._extract_manifest_from_url(plugin_zip_url, plugin_name, token)
+            manifest = self._extract_manifest_from_url(plugin_zip_url, plugin_name, self.tokens.asset_headers_for(token_name))
             if manifest:
                 manifest["RepoUrl"] = repo_url
                 manifest["_repository_source"] = True
                 manifest["_repository_asset_url"] = plugin_zip_url
-                manifest["_repository_token_name"] = token_name
+                manifest["_repository_asset_name"] = plugin_asset.get("name")
                 if release_timestamp:
                     manifest["LastUpdate"] = release_timestamp
 
-                # Check for testing pre-release
-                testing_info = self._get_testing_release_info(owner, repo, plugin_name, token)
+                # Check for testing pre-release, only when the listing has any
+                prereleases = self._list_prereleases(owner, repo, headers)
+                testing_info = self._get_testing_release_info(owner, repo, plugin_name, headers, releases=prereleases) if prereleases else None
                 if testing_info:
                     manifest["TestingAssemblyVersion"] = testing_info["version"]
                     manifest["_testing_download_url"] = testing_info["download_url"]
-                    print(f"Found testing release for {plugin_name}: v{testing_info['version']}")
+                    logger.debug("Found testing release for %s: v%s", plugin_name, testing_info['version'])
 
-                print(f"Successfully extracted manifest for {plugin_name} v{manifest.get('AssemblyVersion', 'unknown')}")
+                logger.debug("Successfully extracted manifest for %s v%s", plugin_name, manifest.get('AssemblyVersion', 'unknown'))
                 return manifest
 
         except Exception as e:
-            print(f"Error processing repository plugin {plugin_name}: {e}")
+            logger.warning(f"Error processing repository plugin {plugin_name}: {e}")
             return None
 
         return None
 
-    def _find_plugin_asset(self, release_data: Dict[str, Any], plugin_name: str) -> Optional[str]:
+    def _list_prereleases(self, owner: str, repo: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Pre-releases from the full listing; a failed listing only means no testing info."""
+        try:
+            status_code, releases = self.fetcher.get_all_releases(owner, repo, headers)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not list releases for {owner}/{repo}, skipping testing lookup: {e}")
+            return []
+        if status_code != 200:
+            logger.warning(f"Could not list releases for {owner}/{repo} (HTTP {status_code}), skipping testing lookup")
+            return []
+        return [r for r in releases if r.get("prerelease")]
+
+    def _find_plugin_asset(self, release_data: Dict[str, Any], plugin_name: str) -> Optional[Dict[str, Any]]:
         """Find the best plugin ZIP asset from release assets."""
         assets = release_data.get("assets", [])
         
-        print(f"Available assets for {plugin_name}: {[asset.get('name') for asset in assets]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available assets for %s: %s", plugin_name, [asset.get('name') for asset in assets])
 
+        # Single pass over the assets; the first asset wins when names repeat
+        by_name: Dict[str, Dict[str, Any]] = {}
         for asset in assets:
-            if asset.get("name") == "latest.zip":
-                return asset.get("url")
+            by_name.setdefault(asset.get("name", ""), asset)
+        zip_names = [name for name in by_name if name.endswith(".zip")]
 
-        for asset in assets:
-            if asset.get("name") == f"{plugin_name}.zip":
-                return asset.get("url")
-        
-        plugin_name_no_spaces = plugin_name.replace(" ", "")
-        for asset in assets:
-            if asset.get("name") == f"{plugin_name_no_spaces}.zip":
-                return asset.get("url")
+        for candidate in (
+            "latest.zip",
+            f"{plugin_name}.zip",
+            f"{plugin_name.replace(' ', '')}.zip",
+            f"{plugin_name.replace(' ', '-')}.zip",
+        ):
+            if candidate in by_name:
+                return by_name[candidate]
 
-        plugin_name_dashes = plugin_name.replace(" ", "-")
-        for asset in assets:
-            if asset.get("name") == f"{plugin_name_dashes}.zip":
-                return asset.get("url")
+        for asset_name in zip_names:
+            if asset_name.startswith(f"{plugin_name}-"):
+                return by_name[asset_name]
 
-        for asset in assets:
-            asset_name = asset.get("name", "")
-            if asset_name.endswith(".zip") and asset_name.startswith(f"{plugin_name}-"):
-                return asset.get("url")
-
-        for asset in assets:
-            if asset.get("name", "").endswith(".zip"):
-                return asset.get("url")
+        if zip_names:
+            return by_name[zip_names[0]]
 
         return None
 
-    def _get_testing_release_info(self, owner: str, repo: str, plugin_name: str, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Fetch testing pre-release info (version and download URL) from a repository."""
-        try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-            headers = {"Authorization": f"token {token}"} if token else {}
-
-            response = requests.get(api_url, headers=headers, params={"per_page": 30})
-            if response.status_code != 200:
-                return None
+    def _get_testing_release_info(self, owner: str, repo: str, plugin_name: str, headers: Optional[Dict[str, str]] = None,
+                                  releases: Optional[List[Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """Find testing pre-release info (version and download URL) in a repository's releases.
 
-            releases = response.json()
+        Pass `releases` to search an already-fetched listing instead of looking it up.
+        """
+        try:
+            if releases is None:
+                status_code, releases = self.fetcher.get_all_releases(owner, repo, headers)
+                if status_code != 200:
+                    return None
 
             # Find the latest pre-release.
             # Supports two tag formats:
@@ -458,72 +927,87 @@ class RepositoryPluginProcessor:
             return None
 
         except Exception as e:
-            print(f"Error fetching testing release for {owner}/{repo}: {e}")
+            logger.warning(f"Error fetching testing release for {owner}/{repo}: {e}")
             return None
 
-    def _extract_manifest_from_url(self, zip_url: str, plugin_name: str, token: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Download ZIP file and extract plugin manifest."""
+    def _extract_manifest_from_url(self, zip_url: str, plugin_name: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Read the plugin manifest out of a remote ZIP file, reusing the cached one when its ETag is unchanged."""
         try:
-            headers = {}
-            if token:
-                headers["Authorization"] = f"token {token}"
-                headers["Accept"] = "application/octet-stream"
-            
-            response = requests.get(zip_url, headers=headers, stream=True, allow_redirects=True)
-            response.raise_for_status()
+            headers = headers or {}
 
-            temp_zip_path = Path(f"temp_{plugin_name}.zip")
+            # An unchanged asset keeps its ETag, so its previously parsed manifest can be reused
+            # Error replies (rate limits, expired signed URLs) can carry an ETag too, so only trust a success
+            etag = None
             try:
-                with open(temp_zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                actual_plugin_name = plugin_name
-                for alias_name, alias_config in self.config.plugin_aliases.items():
-                    if plugin_name == alias_name:
-                        actual_plugin_name = alias_config["source"]
-                        break
-
-                with ZipFile(temp_zip_path) as z:
-                    # Try to find the manifest file with various naming conventions
-                    manifest_candidates = [
-                        f"{actual_plugin_name}.json",
-                        f"{actual_plugin_name.replace(' ', '')}.json",  # No spaces
-                        f"{actual_plugin_name.replace(' ', '-')}.json",  # Dashes instead of spaces
-                    ]
-                    
-                    # Also check all JSON files in the ZIP (excluding .deps.json files)
-                    all_files = z.namelist()
-                    json_files = [f for f in all_files if f.endswith('.json') and '/' not in f and not f.endswith('.deps.json')]
-                    
-                    manifest_file = None
-                    for candidate in manifest_candidates:
-                        if candidate in all_files:
-                            manifest_file = candidate
-                            break
-                    
-                    # If no match, try the first JSON file at root level (excluding .deps.json)
-                    if not manifest_file and json_files:
-                        manifest_file = json_files[0]
-                        print(f"Using manifest file: {manifest_file}")
-                    
-                    if not manifest_file:
-                        print(f"No manifest JSON found in {zip_url}. Available files: {all_files}")
-                        return None
-                    
-                    manifest_data = z.read(manifest_file).decode("utf-8")
-                    manifest = json.loads(manifest_data)
-            
-                    return manifest
+                with SESSION.head(zip_url, headers=headers, allow_redirects=True) as head:
+                    if head.ok:
+                        etag = head.headers.get("ETag")
+            except requests.exceptions.RequestException:
+                pass
+            if etag:
+                cached = self.manifest_cache.load(plugin_name, etag)
+                if cached is not None:
+                    logger.debug("Using cached manifest for %s (ETag %s)", plugin_name, etag)
+                    return cached
 
-            finally:
-                if temp_zip_path.exists():
-                    temp_zip_path.unlink()
+            manifest = self._download_manifest(zip_url, plugin_name, headers)
+            if manifest is not None and etag:
+                self.manifest_cache.store(plugin_name, etag, manifest)
+            return manifest
 
         except Exception as e:
-            print(f"Error extracting manifest from {zip_url}: {e}")
+            logger.warning(f"Error extracting manifest from {zip_url}: {e}")
             return None
 
+    def _download_manifest(self, zip_url: str, plugin_name: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Fetch a remote ZIP and parse its manifest.
+
+        Only the central directory and the manifest entry are fetched with HTTP
+        Range requests; servers without range support get a full download.
+        """
+        try:
+            with RemoteZip(zip_url, session=SESSION, headers=headers) as z:
+                return self._read_manifest_from_zip(z, plugin_name, zip_url)
+        except RangeNotSupported:
+            logger.debug("Range requests not supported for %s, downloading full archive", zip_url)
+
+
+        response = SESSION.get(zip_url, headers=headers, stream=True, allow_redirects=True)
+        response.raise_for_status()
+
+        # Buffer in memory: only the small manifest is needed, so skip the temp file round-trip
+        buf = io.BytesIO()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buf, length=COPY_BUFFER_SIZE)
+        buf.seek(0)
+
+        with ZipFile(buf) as z:
+            return self._read_manifest_from_zip(z, plugin_name, zip_url)
+
+    def _read_manifest_from_zip(self, z: ZipFile, plugin_name: str, zip_url: str) -> Optional[Dict[str, Any]]:
+        """Locate and parse the plugin manifest inside an opened ZIP file."""
+        actual_plugin_name = self.config.plugin_aliases.get(plugin_name, {}).get("source", plugin_name)
+
+        # Also check all JSON files in the ZIP (excluding .deps.json files)
+        all_files = z.namelist()
+        file_names = set(all_files)
+        json_files = [f for f in all_files if f.endswith('.json') and '/' not in f and not f.endswith('.deps.json')]
+        
+        # Try to find the manifest file with various naming conventions
+        manifest_file = next((c for c in _manifest_candidates(actual_plugin_name) if c in file_names), None)
+        
+        # If no match, try the first JSON file at root level (excluding .deps.json)
+        if not manifest_file and json_files:
+            manifest_file = json_files[0]
+            logger.debug("Using manifest file: %s", manifest_file)
+        
+        if not manifest_file:
+            logger.warning(f"No manifest JSON found in {zip_url}. Available files: {all_files}")
+            return None
+        
+        # Drop unused fields right away so they are never held in memory or cached
+        return _keep_keys(_json_loads(z.read(manifest_file)), self.config.required_manifest_keys_set)
+
 
 class ExternalPluginManager:
     """Handles downloading and caching of external plugins."""
@@ -532,7 +1016,8 @@ class ExternalPluginManager:
         self.config = config
 
     def download_external_plugins(self) -> None:
-        """Download all configured external plugins."""
+        """Download all configured external plugins concurrently."""
+        downloads = []
         for plugin_name, urls in self.config.external_plugins.items():
             plugin_dir = self.config.plugins_dir / plugin_name
             plugin_dir.mkdir(parents=True, exist_ok=True)
@@ -545,59 +1030,59 @@ class ExternalPluginManager:
                     variant_dir.mkdir(exist_ok=True)
                     dest_path = variant_dir / "latest.zip"
 
-                self._download_if_needed(url, dest_path)
+                downloads.append((url, dest_path))
+
+        # Each worker downloads and validates its own archive, so validation overlaps other transfers
+        with ThreadPoolExecutor(max_workers=HTTP_WORKERS) as executor:
+            list(executor.map(lambda item: self._download_if_needed(*item), downloads))
 
     def _download_if_needed(self, url: str, dest_path: Path) -> bool:
-        """Download file only if it's newer than local copy."""
+        """Download file only if it's newer than local copy, using a single conditional GET."""
         try:
-            if self._is_up_to_date(url, dest_path):
-                print(f"Skipping {url} - already up to date")
+            response = SESSION.get(url, headers=self._conditional_headers(dest_path), stream=True)
+            if response.status_code == 304:
+                response.close()
+                logger.debug("Skipping %s - already up to date", url)
                 return True
-
-            print(f"Downloading {url} to {dest_path}")
-            response = requests.get(url, stream=True)
             response.raise_for_status()
 
-            with open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            logger.debug("Downloading %s to %s", url, dest_path)
+            buf = io.BytesIO()
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, buf, length=COPY_BUFFER_SIZE)
 
-            with ZipFile(dest_path) as z:
-                pass
+            # Validate in memory so a bad archive never replaces the local copy
+            with ZipFile(buf) as z:
+                bad_member = z.testzip()
+                if bad_member:
+                    raise ValueError(f"corrupt member {bad_member} in downloaded archive")
 
+            dest_path.write_bytes(buf.getvalue())
             self._save_metadata(response, dest_path)
             return True
 
         except Exception as e:
-            print(f"Error downloading {url}: {e}")
-            if dest_path.exists():
-                dest_path.unlink()
+            logger.warning(f"Error downloading {url}: {e}")
             return False
 
-    def _is_up_to_date(self, url: str, dest_path: Path) -> bool:
-        """Check if local file is up to date based on HTTP headers."""
-        if not dest_path.exists():
-            return False
+    def _conditional_headers(self, dest_path: Path) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the saved metadata of a local copy."""
+        metadata_file = dest_path.with_suffix('.meta')
+        if not dest_path.exists() or not metadata_file.exists():
+            return {}
 
         try:
-            head_response = requests.head(url)
-            head_response.raise_for_status()
-
-            metadata_file = dest_path.with_suffix('.meta')
-            if not metadata_file.exists():
-                return False
-
             with open(metadata_file, 'r') as f:
                 metadata = json.load(f)
-
-            etag = head_response.headers.get('ETag')
-            last_modified = head_response.headers.get('Last-Modified')
-
-            return ((etag and metadata.get('ETag') == etag) or
-                    (last_modified and metadata.get('Last-Modified') == last_modified))
-
         except Exception:
-            return False
+            return {}
+
+        headers = {}
+        if metadata.get('ETag'):
+            headers['If-None-Match'] = metadata['ETag']
+        if metadata.get('Last-Modified'):
+            headers['If-Modified-Since'] = metadata['Last-Modified']
+        return headers
 
     def _save_metadata(self, response: requests.Response, dest_path: Path) -> None:
         """Save HTTP metadata for future comparison."""
@@ -613,94 +1098,95 @@ class ExternalPluginManager:
 class DownloadCountUpdater:
     """Handles updating download counts from GitHub releases."""
 
-    def __init__(self):
-        self.github_token = os.environ.get("GITHUB_TOKEN")
-        self.headers = {"Authorization": f"token {self.github_token}"} if self.github_token else {}
+    def __init__(self, fetcher: RepositoryFetcher, tokens: TokenRegistry):
+        self.fetcher = fetcher
+        self.headers = tokens.headers_for("GITHUB_TOKEN")
+        github_token = tokens.token("GITHUB_TOKEN")
+        # GraphQL requires authentication; without a token every repository goes through REST
+        self.graphql = GitHubGraphQL(github_token) if github_token else None
         self.repo_cache = {}
 
-    def update_download_counts(self, manifests: List[Dict[str, Any]]) -> None:
-        """Update download counts for all manifests."""
-        for manifest in manifests:
-            try:
-                repo_url = manifest.get("RepoUrl", "")
-                if not repo_url or "github.com" not in repo_url:
-                    continue
+    def prefetch_download_counts(self, repo_urls: List[str]) -> None:
+        """Fetch download counts for every uncached repository in as few requests as possible.
 
-                owner, repo = self._parse_github_url(repo_url)
-                if not owner or not repo:
-                    continue
+        Repositories already listed during manifest extraction are summed locally,
+        the rest go through batched GraphQL queries, and anything GraphQL could
+        not answer falls back to concurrent REST requests.
+        """
+        pending = []
+        for repo_url in repo_urls:
+            parsed = parse_github(repo_url or "")
+            if parsed and f"{parsed[0]}/{parsed[1]}" not in self.repo_cache and parsed not in pending:
+                pending.append(parsed)
+
+        unfetched = [parts for parts in pending if not self.fetcher.has_releases(*parts)]
+        if self.graphql and unfetched:
+            logger.info(f"Fetching download counts for {len(unfetched)} repositories via GraphQL")
+            for (owner, repo), releases in self.graphql.fetch_releases(unfetched).items():
+                self.repo_cache[f"{owner}/{repo}"] = self._sum_downloads(releases)
+            pending = [(owner, repo) for owner, repo in pending if f"{owner}/{repo}" not in self.repo_cache]
+
+        with ThreadPoolExecutor(max_workers=HTTP_FOLLOWUP_WORKERS) as executor:
+            counts = executor.map(lambda parts: self._fetch_download_count(*parts), pending)
+            for (owner, repo), count in zip(pending, counts):
+                self.repo_cache[f"{owner}/{repo}"] = count
 
-                repo_key = f"{owner}/{repo}"
+    def update_download_counts(self, manifests: List[Dict[str, Any]]) -> None:
+        """Update download counts for all manifests, fetching any repositories not yet prefetched."""
+        self.prefetch_download_counts([manifest.get("RepoUrl", "") for manifest in manifests])
 
-                if repo_key not in self.repo_cache:
-                    self.repo_cache[repo_key] = self._fetch_download_count(owner, repo)
+        for manifest in manifests:
+            plugin_name = manifest.get("InternalName", "unknown")
+            parsed = parse_github(manifest.get("RepoUrl", ""))
+            if not parsed:
+                continue
 
-                manifest["DownloadCount"] = self.repo_cache[repo_key]
-                print(f"Updated {manifest['InternalName']}: {manifest['DownloadCount']} downloads")
+            try:
+                download_count = self.repo_cache[f"{parsed[0]}/{parsed[1]}"]
+                manifest["DownloadCount"] = download_count
+                logger.debug("Updated %s: %s downloads", plugin_name, download_count)
 
             except Exception as e:
-                print(f"Error updating download count for {manifest.get('InternalName', 'unknown')}: {e}")
+                logger.warning(f"Error updating download count for {plugin_name}: {e}")
 
-    def _parse_github_url(self, url: str) -> Tuple[Optional[str], Optional[str]]:
-        """Parse GitHub URL to extract owner and repo."""
-        try:
-            repo_path = url.replace("https://github.com/", "").rstrip("/")
-            if "/" in repo_path:
-                return repo_path.split("/", 1)
-        except Exception:
-            pass
-        return None, None
+    @staticmethod
+    def _sum_downloads(releases: List[Dict[str, Any]]) -> int:
+        """Total asset download count across a list of releases."""
+        return sum(asset.get("download_count", 0) for release in releases for asset in release.get("assets", []))
 
     def _fetch_download_count(self, owner: str, repo: str) -> int:
-        """Fetch total download count for a GitHub repository (with pagination)."""
+        """Sum download counts across all releases of a GitHub repository."""
         try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-            print(f"Fetching download counts for {owner}/{repo}")
-
-            total_downloads = 0
-            page = 1
-
-            while True:
-                response = requests.get(
-                    api_url,
-                    headers=self.headers,
-                    params={"per_page": 100, "page": page}
-                )
-
-                if response.status_code == 404:
-                    print(f"Repository {owner}/{repo} not found or is private - skipping download count")
-                    return 0
-                elif response.status_code == 403:
-                    print(f"Access forbidden for {owner}/{repo} (rate limited or private) - skipping download count")
-                    return 0
-                elif response.status_code == 401:
-                    print(f"Authentication required for {owner}/{repo} - skipping download count")
-                    return 0
-
-                response.raise_for_status()
-                releases = response.json()
-
-                if not releases:
-                    break
-
-                for release in releases:
-                    for asset in release.get("assets", []):
-                        total_downloads += asset.get("download_count", 0)
-
-                if len(releases) < 100:
-                    break
-                page += 1
+            logger.debug("Fetching download counts for %s/%s", owner, repo)
+
+            # Reuses the release list already fetched for manifest extraction when available
+            status_code, releases = self.fetcher.get_all_releases(owner, repo, self.headers)
+
+            if status_code == 404:
+                logger.warning(f"Repository {owner}/{repo} not found or is private - skipping download count")
+                return 0
+            elif status_code == 403:
+                logger.warning(f"Access forbidden for {owner}/{repo} (rate limited or private) - skipping download count")
+                return 0
+            elif status_code == 401:
+                logger.warning(f"Authentication required for {owner}/{repo} - skipping download count")
+                return 0
+            elif status_code != 200:
+                logger.warning(f"Error fetching download count for {owner}/{repo}: HTTP {status_code}")
+                return 0
+
+            total_downloads = self._sum_downloads(releases)
 
             if total_downloads == 0:
-                print(f"Repository {owner}/{repo} has no releases or no downloads")
+                logger.info(f"Repository {owner}/{repo} has no releases or no downloads")
 
             return total_downloads
 
         except requests.exceptions.RequestException as e:
-            print(f"Network error fetching download count for {owner}/{repo}: {e}")
+            logger.warning(f"Network error fetching download count for {owner}/{repo}: {e}")
             return 0
         except Exception as e:
-            print(f"Unexpected error fetching download count for {owner}/{repo}: {e}")
+            logger.warning(f"Unexpected error fetching download count for {owner}/{repo}: {e}")
             return 0
 
 
@@ -709,141 +1195,170 @@ class PluginMasterGenerator:
 
     def __init__(self, config: Config):
         self.config = config
-        self.processor = PluginProcessor(config)
-        self.repo_processor = RepositoryPluginProcessor(config)
+        self.tokens = TokenRegistry(config)
+        self.fetcher = RepositoryFetcher(config)
+        self.processor = PluginProcessor(config, self.fetcher)
+        self.repo_processor = RepositoryPluginProcessor(config, self.fetcher, self.tokens)
         self.external_manager = ExternalPluginManager(config)
-        self.download_updater = DownloadCountUpdater()
+        self.download_updater = DownloadCountUpdater(self.fetcher, self.tokens)
         self.existing_download_counts = {}
+        # Run timestamp shared by every manifest that has no file or release date to use; set by generate()
+        self._now: Optional[str] = None
+        # Output name -> digests of the manifests as previously written, used to skip rewriting unchanged files
+        self.existing_digests: Dict[str, List[bytes]] = {}
 
     def generate(self) -> None:
         """Generate the plugin master file."""
-        print("Starting plugin master generation...")
+        logger.info("Starting plugin master generation...")
+        self._now = str(int(time.time()))
 
         self._load_existing_download_counts()
 
-        if self.config.external_plugins:
-            print("Downloading external plugins...")
-            self.external_manager.download_external_plugins()
+        logger.info("Collecting plugin manifests...")
+        # External downloads only feed the local plugins directory, so they overlap the repository fetch
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            external_future = None
+            if self.config.external_plugins:
+                logger.info("Downloading external plugins...")
+                external_future = executor.submit(self.external_manager.download_external_plugins)
 
-        print("Collecting plugin manifests...")
-        manifests = self._collect_manifests_with_priority()
+            logger.info("Processing repository-configured plugins...")
+            repo_manifests = self.repo_processor.get_repository_plugins()
 
+            if external_future:
+                external_future.result()
+
+        manifests = self._collect_manifests_with_priority(repo_manifests)
+
+        # Repository manifests carry their asset name, so link resolution makes no network calls
         for manifest in manifests:
             self.processor.add_download_links(manifest)
 
-        print("Updating download counts...")
+        logger.info("Updating download counts...")
+        # One batch covers the main manifests and every alias source repository
+        self.download_updater.prefetch_download_counts(
+            [m.get("RepoUrl", "") for m in manifests] +
+            [alias_config["source_repo"] for alias_config in self.config.plugin_aliases.values()]
+        )
         self.download_updater.update_download_counts(manifests)
-    
-        for manifest in manifests:
-            plugin_name = manifest.get("InternalName")
-            if manifest.get("DownloadCount", 0) == 0 and plugin_name in self.existing_download_counts:
-                manifest["DownloadCount"] = self.existing_download_counts[plugin_name]
-                print(f"Using cached download count for {plugin_name}: {manifest['DownloadCount']}")
 
         self._update_last_modified(manifests)
 
-        # Preserve output routing through trim
-        output_routing = {}
+        # Single pass: backfill cached download counts, then trim while keeping the output routing key
+        restored_counts = 0
+        trimmed_manifests = []
         for m in manifests:
-            output_routing[m.get("InternalName")] = m.get("_output_name", "default")
+            plugin_name = m.get("InternalName")
+            if m.get("DownloadCount", 0) == 0 and plugin_name in self.existing_download_counts:
+                m["DownloadCount"] = self.existing_download_counts[plugin_name]
+                restored_counts += 1
 
-        manifests = [self.processor.trim_manifest(m) for m in manifests]
+            trimmed_manifests.append(self.processor.trim_manifest(m, preserve=("_output_name",)))
+        manifests = trimmed_manifests
 
-        # Re-attach output routing after trim
-        for m in manifests:
-            m["_output_name"] = output_routing.get(m.get("InternalName"), "default")
+        if restored_counts:
+            logger.info(f"Restored cached download counts for {restored_counts} plugins")
 
-        print("Writing plugin master file(s)...")
+        logger.info("Writing plugin master file(s)...")
         self._write_plugin_master(manifests)
 
-        print("Generating alias plugin master files...")
+        logger.info("Generating alias plugin master files...")
         self._generate_alias_files()
 
-        print(f"Generated plugin master with {len(manifests)} plugins")
+        self.repo_processor.manifest_cache.prune()
+
+        logger.info(f"Generated plugin master with {len(manifests)} plugins")
 
     def _generate_alias_files(self) -> None:
-        """Generate separate pluginmaster files for aliases."""
-        for alias_name, alias_config in self.config.plugin_aliases.items():
-            print(f"\nGenerating alias file for {alias_name}...")
-    
-            source_plugin = alias_config["source"]
-            source_repo = alias_config["source_repo"]
-            output_file = Path(alias_config["output_file"])
-            name_suffix = alias_config.get("name_suffix", " (Alternative)")
-    
-            repo_processor = RepositoryPluginProcessor(self.config)
-            # For aliases, default to GITHUB_TOKEN
-            manifest = repo_processor._get_manifest_from_repository(source_plugin, source_repo, "GITHUB_TOKEN")
-    
-            if not manifest:
-                print(f"Could not fetch manifest for {source_plugin}, skipping alias {alias_name}")
-                continue
-    
-            manifest["InternalName"] = alias_name
-            manifest["Name"] = f"{manifest.get('Name', source_plugin)}{name_suffix}"
-    
-            manifest = self.processor.trim_manifest(manifest)
-            self.processor.add_download_links(manifest)
-    
-            self.download_updater.update_download_counts([manifest])
-    
-            if manifest.get("DownloadCount", 0) == 0 and alias_name in self.existing_download_counts:
-                manifest["DownloadCount"] = self.existing_download_counts[alias_name]
-    
-            import time
-            manifest["LastUpdate"] = str(int(time.time()))
-            print(f"Set current timestamp for {alias_name}: {manifest['LastUpdate']}")
-    
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump([manifest], f, indent=4, ensure_ascii=False, sort_keys=True)
-    
-            print(f"Successfully generated {output_file} for {alias_name}")
+        """Generate separate pluginmaster files for aliases, processing aliases concurrently."""
+        if not self.config.plugin_aliases:
+            return
+
+        # A smaller pool keeps alias requests polite to GitHub
+        with ThreadPoolExecutor(max_workers=HTTP_FOLLOWUP_WORKERS) as executor:
+            list(executor.map(lambda item: self._process_alias(*item), self.config.plugin_aliases.items()))
+
+    def _process_alias(self, alias_name: str, alias_config: Dict[str, Any]) -> None:
+        """Fetch an alias's source manifest and write its pluginmaster file."""
+        logger.debug("Generating alias file for %s...", alias_name)
+
+        source_plugin = alias_config["source"]
+        source_repo = alias_config["source_repo"]
+        output_file = Path(alias_config["output_file"])
+        name_suffix = alias_config.get("name_suffix", " (Alternative)")
+
+        # For aliases, default to GITHUB_TOKEN; aliases sharing a source reuse one fetch
+        manifest = self.repo_processor.get_manifest(source_plugin, source_repo, "GITHUB_TOKEN")
+
+        if not manifest:
+            logger.warning(f"Could not fetch manifest for {source_plugin}, skipping alias {alias_name}")
+            return
+
+        manifest["InternalName"] = alias_name
+        manifest["Name"] = f"{manifest.get('Name', source_plugin)}{name_suffix}"
+
+        manifest = self.processor.trim_manifest(manifest)
+        self.processor.add_download_links(manifest)
+
+        self.download_updater.update_download_counts([manifest])
+
+        if manifest.get("DownloadCount", 0) == 0 and alias_name in self.existing_download_counts:
+            manifest["DownloadCount"] = self.existing_download_counts[alias_name]
+
+        manifest["LastUpdate"] = self._now
+        logger.debug("Set current timestamp for %s: %s", alias_name, manifest['LastUpdate'])
+
+        _write_json_atomic(output_file, [manifest])
+
+        logger.debug("Successfully generated %s for %s", output_file, alias_name)
 
     def _load_existing_download_counts(self) -> None:
         """Load download counts from existing output files if they exist."""
         for output_name, output_path in self.config.output_files.items():
             if output_path.exists():
                 try:
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                        for plugin in existing_data:
-                            plugin_name = plugin.get("InternalName")
-                            download_count = plugin.get("DownloadCount", 0)
-                            if plugin_name:
-                                self.existing_download_counts[plugin_name] = download_count
-                    print(f"Loaded existing download counts from {output_path} ({output_name})")
+                    digests = []
+                    # Only the counts and digests are kept; the parsed manifests are dropped after this loop
+                    for plugin in _json_loads(output_path.read_bytes()):
+                        plugin_name = plugin.get("InternalName")
+                        download_count = plugin.get("DownloadCount", 0)
+                        if plugin_name:
+                            self.existing_download_counts[plugin_name] = download_count
+                        digests.append(_manifest_digest(plugin))
+                    self.existing_digests[output_name] = digests
+                    logger.info(f"Loaded existing download counts from {output_path} ({output_name})")
                 except Exception as e:
-                    print(f"Could not load existing download counts from {output_path}: {e}")
+                    logger.warning(f"Could not load existing download counts from {output_path}: {e}")
 
-    def _collect_manifests_with_priority(self) -> List[Dict[str, Any]]:
-        """Collect plugin manifests with repository-first priority system."""
+    def _collect_manifests_with_priority(self, repo_manifests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge fetched repository manifests with local ones using a repository-first priority system."""
         manifests = []
         processed_plugins = set()
 
-        print("Processing repository-configured plugins...")
-        repo_manifests = self.repo_processor.get_repository_plugins()
+        # Each local plugin directory is read once and serves both the version comparison and the local-only pass
+        logger.info("Scanning local plugins...")
+        local_by_dir = self._collect_local_manifests()
 
         for manifest in repo_manifests:
             plugin_name = manifest.get("InternalName")
             if plugin_name:
-                local_manifest = self._get_local_manifest(plugin_name)
+                dir_manifests = local_by_dir.get(plugin_name)
+                local_manifest = dir_manifests[0] if dir_manifests else None
 
                 if local_manifest:
                     chosen_manifest = self._choose_better_manifest(repo_manifest=manifest, local_manifest=local_manifest, plugin_name=plugin_name)
                     manifests.append(chosen_manifest)
                 else:
-                    print(f"Using repository version for {plugin_name} (no local version found)")
+                    logger.debug("Using repository version for %s (no local version found)", plugin_name)
                     manifests.append(manifest)
 
                 processed_plugins.add(plugin_name)
 
-        print("Processing remaining local plugins...")
-        local_manifests = self._collect_local_manifests()
-
-        for manifest in local_manifests:
+        logger.info("Processing remaining local plugins...")
+        for manifest in chain.from_iterable(local_by_dir.values()):
             plugin_name = manifest.get("InternalName")
             if plugin_name and plugin_name not in processed_plugins:
-                print(f"Using local version for {plugin_name} (not in repository list)")
+                logger.debug("Using local version for %s (not in repository list)", plugin_name)
                 manifests.append(manifest)
                 processed_plugins.add(plugin_name)
 
@@ -858,70 +1373,56 @@ class PluginMasterGenerator:
 
         return manifests
 
-    def _get_local_manifest(self, plugin_name: str) -> Optional[Dict[str, Any]]:
-        """Get manifest from local plugins directory."""
-        plugin_dir = self.config.plugins_dir / plugin_name
-        if plugin_dir.exists() and plugin_dir.is_dir():
-            local_manifests = self.processor.process_plugin_directory(plugin_dir)
-            return local_manifests[0] if local_manifests else None
-        return None
-
-    def _collect_local_manifests(self) -> List[Dict[str, Any]]:
-        """Collect all plugin manifests from the local plugins directory."""
-        manifests = []
-
+    def _collect_local_manifests(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Collect plugin manifests from the local plugins directory, keyed by plugin directory name."""
         if not self.config.plugins_dir.exists():
-            print(f"Plugins directory {self.config.plugins_dir} does not exist")
-            return manifests
-
-        for plugin_dir in self.config.plugins_dir.iterdir():
-            if plugin_dir.is_dir():
-                plugin_manifests = self.processor.process_plugin_directory(plugin_dir)
-                manifests.extend(plugin_manifests)
-
-        return manifests
+            logger.warning(f"Plugins directory {self.config.plugins_dir} does not exist")
+            return {}
+
+        with os.scandir(self.config.plugins_dir) as entries:
+            plugin_dirs = [entry.path for entry in entries if entry.is_dir()]
+        # Directory reads overlap across threads; map keeps the directory order
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            return {
+                os.path.basename(plugin_dir): dir_manifests
+                for plugin_dir, dir_manifests in zip(plugin_dirs, executor.map(self.processor.process_plugin_directory, map(Path, plugin_dirs)))
+            }
 
     def _choose_better_manifest(self, repo_manifest: Dict[str, Any], local_manifest: Dict[str, Any], plugin_name: str) -> Dict[str, Any]:
         """Choose between repository and local manifest based on version comparison."""
         repo_version = repo_manifest.get("AssemblyVersion", "0.0")
         local_version = local_manifest.get("AssemblyVersion", "0.0")
 
-        print(f"Comparing versions for {plugin_name}: repo={repo_version}, local={local_version}")
+        logger.debug("Comparing versions for %s: repo=%s, local=%s", plugin_name, repo_version, local_version)
 
         if repo_version == local_version:
-            print(f"Versions are equal for {plugin_name}, prioritising repository version")
+            logger.debug("Versions are equal for %s, prioritising repository version", plugin_name)
             return repo_manifest
 
         try:
-            repo_parts = [int(x) for x in repo_version.split('.')]
-            local_parts = [int(x) for x in local_version.split('.')]
-
-            max_len = max(len(repo_parts), len(local_parts))
-            repo_parts.extend([0] * (max_len - len(repo_parts)))
-            local_parts.extend([0] * (max_len - len(local_parts)))
-
-            if repo_parts >= local_parts:
-                print(f"Repository version is newer or equal for {plugin_name}, using repository")
+            if _parse_version(repo_version) >= _parse_version(local_version):
+                logger.debug("Repository version is newer or equal for %s, using repository", plugin_name)
                 return repo_manifest
             else:
-                print(f"Local version is newer for {plugin_name}, using local")
+                logger.debug("Local version is newer for %s, using local", plugin_name)
                 return local_manifest
 
         except ValueError:
-            print(f"Could not parse versions for {plugin_name}, prioritising repository")
+            logger.warning(f"Could not parse versions for {plugin_name}, prioritising repository")
             return repo_manifest
 
-    def _write_plugin_master(self, manifests: List[Dict[str, Any]], final: bool = True) -> None:
-        """Write plugin master JSON file(s), grouped by output routing."""
+    def _write_plugin_master(self, manifests: List[Dict[str, Any]]) -> None:
+        """Write plugin master JSON file(s), grouped by output routing.
+
+        Consumes the `_output_name` routing key from each manifest in place.
+        """
         # Group manifests by output name
         grouped: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.config.output_files}
         for m in manifests:
-            output_name = m.get("_output_name", "default")
+            output_name = m.pop("_output_name", None)
             if output_name not in grouped:
                 output_name = "default"
-            # Only pop _output_name on final write
-            clean = {k: v for k, v in m.items() if k != "_output_name"} if final else dict(m)
-            grouped.setdefault(output_name, []).append(clean)
+            grouped.setdefault(output_name, []).append(m)
 
         current_output_paths = set()
         for output_name, output_path in self.config.output_files.items():
@@ -929,62 +1430,77 @@ class PluginMasterGenerator:
             if not output_manifests and output_name != "default":
                 if output_path.exists():
                     output_path.unlink()
-                    print(f"Removed empty output file: {output_path} ({output_name})")
+                    logger.info(f"Removed empty output file: {output_path} ({output_name})")
                 continue
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_manifests, f, indent=4, ensure_ascii=False, sort_keys=True)
-            current_output_paths.add(output_path.resolve())
-            print(f"Wrote {len(output_manifests)} plugins to {output_path} ({output_name})")
+            current_output_paths.add(os.path.abspath(output_path))
+            if output_path.exists() and self._is_unchanged(output_name, output_manifests):
+                logger.info(f"No changes for {output_path} ({output_name}), skipping write")
+                continue
+            _write_json_atomic(output_path, output_manifests)
+            logger.info(f"Wrote {len(output_manifests)} plugins to {output_path} ({output_name})")
+
+        self._cleanup_stale_outputs(current_output_paths)
 
-        if final:
-            self._cleanup_stale_outputs(current_output_paths)
+    def _is_unchanged(self, output_name: str, output_manifests: List[Dict[str, Any]]) -> bool:
+        """Whether every manifest hashes identically to the one previously written in the same position."""
+        existing = self.existing_digests.get(output_name)
+        if existing is None or len(existing) != len(output_manifests):
+            return False
+        return all(_manifest_digest(new) == old for new, old in zip(output_manifests, existing))
 
     def _cleanup_stale_outputs(self, current_output_paths: set) -> None:
-        """Remove output JSON files that are no longer in the config."""
-        protected = {Path("./plugin-sources.json").resolve()}
-        for json_file in Path(".").glob("*.json"):
-            resolved = json_file.resolve()
-            if resolved not in current_output_paths and resolved not in protected:
-                json_file.unlink()
-                print(f"Removed stale output file: {json_file}")
+        """Remove top-level output JSON files that are no longer in the config.
+
+        Outputs are matched by absolute path, so an output in a subdirectory
+        never protects a stale top-level file of the same name.
+        """
+        protected_paths = {os.path.abspath("plugin-sources.json")} | current_output_paths
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if (entry.name.endswith(".json") and entry.is_file()
+                        and os.path.abspath(entry.path) not in protected_paths):
+                    os.unlink(entry.path)
+                    logger.info(f"Removed stale output file: {entry.name}")
 
     def _update_last_modified(self, manifests: List[Dict[str, Any]]) -> None:
         """Update LastUpdate timestamps based on file modification times or repository release dates."""
         for manifest in manifests:
+            plugin_name = manifest.get("InternalName")
             try:
-                if manifest.get("_repository_source"):
-                    if "LastUpdate" in manifest:
-                        print(f"Preserving GitHub release timestamp for {manifest['InternalName']}: {manifest['LastUpdate']}")
-                        del manifest["_repository_source"]
-                    else:
-                        del manifest["_repository_source"]
-                        self._set_local_timestamp(manifest, manifest["InternalName"])
+                if manifest.pop("_repository_source", False) and "LastUpdate" in manifest:
+                    logger.debug("Preserving GitHub release timestamp for %s: %s", plugin_name, manifest['LastUpdate'])
                 else:
-                    self._set_local_timestamp(manifest, manifest["InternalName"])
+                    self._set_local_timestamp(manifest, plugin_name)
 
             except Exception as e:
-                print(f"Error updating last modified time for {manifest.get('InternalName', 'unknown')}: {e}")
-
-        self._write_plugin_master(manifests, final=False)
+                logger.warning(f"Error updating last modified time for {plugin_name or 'unknown'}: {e}")
 
     def _set_local_timestamp(self, manifest: Dict[str, Any], plugin_name: str) -> None:
         """Set timestamp from local file modification time."""
         is_global = manifest["Name"].endswith(f"(API{self.config.global_api_level})")
-        
+
         if is_global:
             zip_path = self.config.plugins_dir / plugin_name / "global" / "latest.zip"
         else:
             zip_path = self.config.plugins_dir / plugin_name / "latest.zip"
 
-        if zip_path.exists():
+        # Local ZIPs were already stat'ed while their manifests were read
+        cached_mtime = self.processor.zip_mtimes.get(zip_path)
+        if cached_mtime is not None:
+            manifest["LastUpdate"] = str(cached_mtime)
+        elif zip_path.exists():
             modified_time = str(int(zip_path.stat().st_mtime))
             manifest["LastUpdate"] = modified_time
         else:
-            import time
-            manifest["LastUpdate"] = str(int(time.time()))
+            manifest["LastUpdate"] = self._now
 
 def main():
     """Main entry point."""
+    # Per-plugin progress is only shown when the workflow is re-run with debug logging enabled
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("RUNNER_DEBUG") == "1" else logging.INFO,
+        format="%(levelname)s: %(message)s",
+    )
     config = Config.load_default()
     generator = PluginMasterGenerator(config)
     generator.generate()